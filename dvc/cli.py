@@ -1,100 +1,103 @@
 """DVC command line interface"""
 import argparse
+import importlib
 import logging
 import os
 import sys
+from functools import lru_cache
 
 from ._debug import add_debugging_flags
-from .command import (
-    add,
-    cache,
-    check_ignore,
-    checkout,
-    commit,
-    completion,
-    config,
-    daemon,
-    dag,
-    data_sync,
-    destroy,
-    diff,
-    experiments,
-    freeze,
-    gc,
-    get,
-    get_url,
-    git_hook,
-    imp,
-    imp_url,
-    init,
-    install,
-    live,
-    ls,
-    metrics,
-    move,
-    params,
-    plots,
-    remote,
-    remove,
-    repro,
-    root,
-    run,
-    stage,
-    unprotect,
-    update,
-    version,
-)
 from .command.base import fix_subparsers
 from .exceptions import DvcParserError
 
 logger = logging.getLogger(__name__)
 
-COMMANDS = [
-    init,
-    get,
-    get_url,
-    destroy,
-    add,
-    remove,
-    move,
-    unprotect,
-    run,
-    repro,
-    data_sync,
-    gc,
-    imp,
-    imp_url,
-    config,
-    checkout,
-    remote,
-    cache,
-    metrics,
-    params,
-    install,
-    root,
-    ls,
-    freeze,
-    dag,
-    daemon,
-    commit,
-    completion,
-    diff,
-    version,
-    update,
-    git_hook,
-    plots,
-    stage,
-    experiments,
-    check_ignore,
-    live,
-]
-
-
-def _find_parser(parser, cmd_cls):
+# NOTE: maps every top-level command name (aliases included) to the module
+# that defines its parser. Modules are imported lazily, so that we could
+# import and build only the subparser for the command that is being invoked.
+COMMAND_MODULES = {
+    "init": "dvc.command.init",
+    "get": "dvc.command.get",
+    "get-url": "dvc.command.get_url",
+    "destroy": "dvc.command.destroy",
+    "add": "dvc.command.add",
+    "remove": "dvc.command.remove",
+    "move": "dvc.command.move",
+    "unprotect": "dvc.command.unprotect",
+    "run": "dvc.command.run",
+    "repro": "dvc.command.repro",
+    "pull": "dvc.command.data_sync",
+    "push": "dvc.command.data_sync",
+    "fetch": "dvc.command.data_sync",
+    "status": "dvc.command.data_sync",
+    "gc": "dvc.command.gc",
+    "import": "dvc.command.imp",
+    "import-url": "dvc.command.imp_url",
+    "config": "dvc.command.config",
+    "checkout": "dvc.command.checkout",
+    "remote": "dvc.command.remote",
+    "cache": "dvc.command.cache",
+    "metrics": "dvc.command.metrics",
+    "params": "dvc.command.params",
+    "install": "dvc.command.install",
+    "root": "dvc.command.root",
+    "list": "dvc.command.ls",
+    "freeze": "dvc.command.freeze",
+    "unfreeze": "dvc.command.freeze",
+    "dag": "dvc.command.dag",
+    "daemon": "dvc.command.daemon",
+    "commit": "dvc.command.commit",
+    "completion": "dvc.command.completion",
+    "diff": "dvc.command.diff",
+    "version": "dvc.command.version",
+    "doctor": "dvc.command.version",
+    "update": "dvc.command.update",
+    "git-hook": "dvc.command.git_hook",
+    "plots": "dvc.command.plots",
+    "stage": "dvc.command.stage",
+    "experiments": "dvc.command.experiments",
+    "exp": "dvc.command.experiments",
+    "check-ignore": "dvc.command.check_ignore",
+    "live": "dvc.command.live",
+}
+
+# NOTE: in the order they are listed in the help message
+COMMANDS = tuple(dict.fromkeys(COMMAND_MODULES.values()))
+
+# NOTE: global options that consume the next argument as their value.
+_OPTIONS_WITH_VALUE = frozenset(["--cd", "--cprofile-dump"])
+
+
+def _find_commands(argv):
+    """Find modules of the commands that are needed to parse argv.
+
+    Returns None if all of them are needed, e.g. when there is no command,
+    it is unknown or the generic help was requested before it.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            return None
+        if arg in ("-V", "--version"):
+            # NOTE: VersionAction exits before any command is looked at.
+            return ()
+        if arg in _OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith("-"):
+            module = COMMAND_MODULES.get(arg)
+            return (module,) if module else None
+    return None
+
+
+# NOTE: populated by DvcParser.set_defaults() as subparsers are being built,
+# so that we don't have to walk the whole tree of parsers on errors.
+_PARSER_BY_FUNC = {}
+
+
+def _walk_parsers(parser, cmd_cls):
     defaults = parser._defaults  # pylint: disable=protected-access
-    if not cmd_cls or cmd_cls == defaults.get("func"):
-        parser.print_help()
-        raise DvcParserError()
+    if cmd_cls == defaults.get("func"):
+        return parser
 
     actions = parser._actions  # pylint: disable=protected-access
     for action in actions:
@@ -102,16 +105,58 @@ def _find_parser(parser, cmd_cls):
             # NOTE: we are only interested in subparsers
             continue
         for subparser in action.choices.values():
-            _find_parser(subparser, cmd_cls)
+            found = _walk_parsers(subparser, cmd_cls)
+            if found:
+                return found
+    return None
+
+
+def _find_parser(parser, cmd_cls):
+    if cmd_cls:
+        # NOTE: walking the tree is only needed for parsers that didn't go
+        # through DvcParser.set_defaults(), e.g. plain argparse ones.
+        found = _PARSER_BY_FUNC.get(cmd_cls) or _walk_parsers(parser, cmd_cls)
+        parser = found or parser
+    parser.print_help()
+    raise DvcParserError()
 
 
 class DvcParser(argparse.ArgumentParser):
     """Custom parser class for dvc CLI."""
 
+    def __init__(self, *args, **kwargs):
+        # NOTE: set before calling super(), as it might add `-h` already.
+        self._validating = False
+        self._formatter = None
+        super().__init__(*args, **kwargs)
+
+    def add_argument(self, *args, **kwargs):
+        # NOTE: argparse creates a new formatter on each add_argument() just
+        # to validate the metavar, which became noticeably more expensive in
+        # Python 3.14 (see python/cpython#142268). A single formatter is
+        # enough for that, while help/usage still get a fresh one each time.
+        self._validating = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating = False
+
+    def _get_formatter(self):
+        if not self._validating:
+            return super()._get_formatter()
+        if self._formatter is None:
+            self._formatter = super()._get_formatter()
+        return self._formatter
+
     def error(self, message, cmd_cls=None):  # pylint: disable=arguments-differ
         logger.error(message)
         _find_parser(self, cmd_cls)
 
+    def set_defaults(self, **kwargs):
+        super().set_defaults(**kwargs)
+        if "func" in kwargs:
+            _PARSER_BY_FUNC[kwargs["func"]] = self
+
     def parse_args(self, args=None, namespace=None):
         # NOTE: overriding to provide a more granular help message.
         # E.g. `dvc plots diff --bad-flag` would result in a `dvc plots diff`
@@ -128,10 +173,26 @@ class VersionAction(argparse.Action):  # pragma: no cover
     """Shows DVC version and exits."""
 
     def __call__(self, parser, namespace, values, option_string=None):
-        from dvc import __version__
+        _show_version()
 
-        print(__version__)
-        sys.exit(0)
+
+def _show_version():  # pragma: no cover
+    from dvc import __version__
+
+    print(__version__)
+    sys.exit(0)
+
+
+_LOG_LEVEL_ARGS = (
+    (
+        ("-q", "--quiet"),
+        {"action": "count", "default": 0, "help": "Be quiet."},
+    ),
+    (
+        ("-v", "--verbose"),
+        {"action": "count", "default": 0, "help": "Be verbose."},
+    ),
+)
 
 
 def get_parent_parser():
@@ -144,17 +205,22 @@ def get_parent_parser():
     parent_parser = argparse.ArgumentParser(add_help=False)
     add_debugging_flags(parent_parser)
     log_level_group = parent_parser.add_mutually_exclusive_group()
-    log_level_group.add_argument(
-        "-q", "--quiet", action="count", default=0, help="Be quiet."
-    )
-    log_level_group.add_argument(
-        "-v", "--verbose", action="count", default=0, help="Be verbose."
-    )
+    for flags, kwargs in _LOG_LEVEL_ARGS:
+        log_level_group.add_argument(*flags, **kwargs)
 
     return parent_parser
 
 
-def get_main_parser():
+# NOTE: parsers are not mutated after being built, so it is safe to reuse
+# them between calls. The cache is bounded by the number of commands.
+@lru_cache(maxsize=None)
+def get_main_parser(commands=None):
+    """Create the main parser for dvc CLI.
+
+    Args:
+        commands: optional tuple of names of the command modules to build
+            subparsers for. All of the commands are added by default.
+    """
     parent_parser = get_parent_parser()
 
     # Main parser
@@ -207,7 +273,8 @@ def get_main_parser():
 
     fix_subparsers(subparsers)
 
-    for cmd in COMMANDS:
+    for name in COMMANDS if commands is None else commands:
+        cmd = importlib.import_module(name)
         cmd.add_parser(subparsers, parent_parser)
 
     return parser
@@ -222,6 +289,17 @@ def parse_args(argv=None):
     Raises:
         dvc.exceptions.DvcParserError: raised for argument parsing errors.
     """
-    parser = get_main_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    elif not isinstance(argv, (list, tuple)):
+        # NOTE: argv is scanned before parsing, so it has to be re-iterable,
+        # but there is no need to copy lists and tuples.
+        argv = list(argv)
+
+    # NOTE: fast path, there is no need to build any parsers for this one.
+    if len(argv) == 1 and argv[0] in ("-V", "--version"):
+        _show_version()
+
+    parser = get_main_parser(_find_commands(argv))
     args = parser.parse_args(argv)
     return args
@@ -1,6 +1,8 @@
 import argparse
+import json
 import logging
-from collections import Counter, OrderedDict, defaultdict
+import sys
+from collections import Counter, defaultdict
 from datetime import date, datetime
 from fnmatch import fnmatch
 from typing import TYPE_CHECKING, Dict, Iterable, Optional
@@ -28,6 +30,12 @@ logger = logging.getLogger(__name__)
 
 SHOW_MAX_WIDTH = 1024
 FILL_VALUE = "-"
+TIME_TODAY_FMT = "%I:%M %p"
+TIME_DATE_FMT = "%b %d, %Y"
+
+
+def _is_pattern(name):
+    return any(char in name for char in "*?[")
 
 
 def _filter_name(names, label, filter_strs):
@@ -44,10 +52,15 @@ def _filter_name(names, label, filter_strs):
         else:
             match_paths = names.keys()
         for match_path in match_paths:
+            path_names = names[match_path]
             for f in filters:
-                matches = [
-                    name for name in names[match_path] if fnmatch(name, f)
-                ]
+                if f in path_names and not _is_pattern(f):
+                    # NOTE: no need to glob through all of the names
+                    matches = [f]
+                else:
+                    matches = [
+                        name for name in path_names if fnmatch(name, f)
+                    ]
                 if not matches:
                     raise InvalidArgumentError(
                         f"'{f}' does not match any known {label}"
@@ -88,18 +101,47 @@ def _filter_names(
     return ret
 
 
+def _flatten_item(item):
+    # NOTE: names are interned, as the same ones are looked up in every row.
+    if not isinstance(item, dict):
+        return item
+    return {sys.intern(name): val for name, val in flatten(item).items()}
+
+
+def _flatten_data(data):
+    return {
+        sys.intern(fname): _flatten_item(item)
+        for fname, item in data.items()
+    }
+
+
+def _flatten_experiments(all_experiments):
+    """Flatten metrics and params of every experiment once, so that
+    collecting names, sorting and building rows could use them as is.
+    """
+    ret = {}
+    for base_rev, experiments in all_experiments.items():
+        ret[base_rev] = {}
+        for rev, exp in experiments.items():
+            exp = dict(exp)
+            for typ in ("metrics", "params"):
+                if typ in exp:
+                    exp[typ] = _flatten_data(exp[typ])
+            ret[base_rev][rev] = exp
+    return ret
+
+
 def _update_names(names, items):
     for name, item in items:
         if isinstance(item, dict):
-            item = flatten(item)
-            names[name].update({key: None for key in item})
+            names[name].update(dict.fromkeys(item))
 
 
 def _collect_names(all_experiments, **kwargs):
     metric_names = defaultdict(dict)
     param_names = defaultdict(dict)
 
-    for _, experiments in all_experiments.items():
+    for experiments in all_experiments.values():
         for exp in experiments.values():
             _update_names(metric_names, exp.get("metrics", {}).items())
             _update_names(param_names, exp.get("params", {}).items())
@@ -137,6 +179,7 @@ def _collect_rows(
     precision=DEFAULT_PRECISION,
     sort_by=None,
     sort_order=None,
+    today=None,
 ):
     from dvc.scm.git import Git
 
@@ -149,6 +192,7 @@ def _collect_rows(
             experiments, sort_path, sort_name, sort_type, reverse
         )
 
+    fmt = _cell_formatter(precision)
     new_checkpoint = True
     for i, (rev, exp) in enumerate(experiments.items()):
         if exp.get("running"):
@@ -197,15 +241,13 @@ def _collect_rows(
             exp_name,
             name_rev,
             typ,
-            _format_time(exp.get("timestamp")),
+            _format_time(exp.get("timestamp"), today),
             parent,
             state,
             executor,
         ]
-        _extend_row(
-            row, metric_names, exp.get("metrics", {}).items(), precision
-        )
-        _extend_row(row, param_names, exp.get("params", {}).items(), precision)
+        _extend_row(row, metric_names, exp.get("metrics", {}), fmt)
+        _extend_row(row, param_names, exp.get("params", {}), fmt)
 
         yield row
 
@@ -247,10 +289,10 @@ def _sort_exp(experiments, sort_path, sort_name, typ, reverse):
             # Sort checkpoint experiments by tip commit
             return _sort((tip, experiments[tip]))
         data = exp.get(typ, {}).get(sort_path, {})
-        val = flatten(data).get(sort_name)
+        val = data.get(sort_name) if isinstance(data, dict) else None
         return val is None, val
 
-    ret = OrderedDict()
+    ret = {}
     if "baseline" in experiments:
         ret["baseline"] = experiments.pop("baseline")
 
@@ -258,44 +300,56 @@ def _sort_exp(experiments, sort_path, sort_name, typ, reverse):
     return ret
 
 
-def _format_time(timestamp):
+def _format_time(timestamp, today=None):
     if timestamp is None:
         return FILL_VALUE
-    if timestamp.date() == date.today():
-        fmt = "%I:%M %p"
+    if timestamp.date() == (today or date.today()):
+        fmt = TIME_TODAY_FMT
     else:
-        fmt = "%b %d, %Y"
+        fmt = TIME_DATE_FMT
     return timestamp.strftime(fmt)
 
 
-def _extend_row(row, names, items, precision):
+def _cell_formatter(precision):
     from rich.text import Text
 
-    from dvc.compare import _format_field, with_value
+    from dvc.compare import _format_field
 
-    if not items:
-        row.extend(FILL_VALUE for keys in names.values() for _ in keys)
-        return
+    def _format(value):
+        if value is None:
+            return FILL_VALUE
+        # wrap field data in rich.Text, otherwise rich may
+        # interpret unescaped braces from list/dict types as rich
+        # markup tags
+        return Text(str(_format_field(value, precision)))
 
-    for fname, item in items:
-        item = flatten(item) if isinstance(item, dict) else {fname: item}
-        for name in names[fname]:
-            value = with_value(item.get(name), FILL_VALUE)
-            # wrap field data in rich.Text, otherwise rich may
-            # interpret unescaped braces from list/dict types as rich
-            # markup tags
-            row.append(Text(str(_format_field(value, precision))))
+    return _format
 
 
-def _parse_filter_list(param_list):
-    ret = []
-    for param_str in param_list:
-        path, _, param_str = param_str.rpartition(":")
-        if path:
-            ret.extend(f"{path}:{param}" for param in param_str.split(","))
-        else:
-            ret.extend(param_str.split(","))
-    return ret
+def _extend_row(row, names, data, fmt):
+    for fname, file_names in names.items():
+        item = data.get(fname, {})
+        if not isinstance(item, dict):
+            item = {fname: item}
+        row.extend(fmt(item.get(name)) for name in file_names)
+
+
+def _parse_filter_list(param_str):
+    path, _, param_str = param_str.rpartition(":")
+    if path:
+        return [f"{path}:{param}" for param in param_str.split(",")]
+    return param_str.split(",")
+
+
+class ExtendAction(argparse.Action):
+    # pylint: disable=too-few-public-methods
+    """Extends the list stored in the namespace with the parsed values."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # NOTE: copy, not to modify the default list in-place
+        items = list(getattr(namespace, self.dest, None) or [])
+        items.extend(values)
+        setattr(namespace, self.dest, items)
 
 
 def experiments_table(
@@ -324,6 +378,7 @@ def experiments_table(
     td = TabularData(
         lconcat(headers, metric_headers, param_headers), fill_value=FILL_VALUE
     )
+    today = date.today()
     for base_rev, experiments in all_experiments.items():
         rows = _collect_rows(
             base_rev,
@@ -333,6 +388,7 @@ def experiments_table(
             sort_by=sort_by,
             sort_order=sort_order,
             precision=precision,
+            today=today,
         )
         td.extend(rows)
 
@@ -367,11 +423,12 @@ def baseline_styler(typ):
 def show_experiments(
     all_experiments, pager=True, no_timestamp=False, **kwargs
 ):
-    include_metrics = _parse_filter_list(kwargs.pop("include_metrics", []))
-    exclude_metrics = _parse_filter_list(kwargs.pop("exclude_metrics", []))
-    include_params = _parse_filter_list(kwargs.pop("include_params", []))
-    exclude_params = _parse_filter_list(kwargs.pop("exclude_params", []))
+    include_metrics = kwargs.pop("include_metrics", [])
+    exclude_metrics = kwargs.pop("exclude_metrics", [])
+    include_params = kwargs.pop("include_params", [])
+    exclude_params = kwargs.pop("exclude_params", [])
 
+    all_experiments = _flatten_experiments(all_experiments)
     metric_names, param_names = _collect_names(
         all_experiments,
         include_metrics=include_metrics,
@@ -469,8 +526,6 @@ class CmdExperimentsShow(CmdBase):
             return 1
 
         if self.args.show_json:
-            import json
-
             ui.write(json.dumps(all_experiments, default=_format_json))
         else:
             show_experiments(
@@ -513,8 +568,6 @@ class CmdExperimentsDiff(CmdBase):
             return 1
 
         if self.args.show_json:
-            import json
-
             ui.write(json.dumps(diff))
         else:
             from dvc.compare import show_diff
@@ -799,28 +852,32 @@ def add_parser(subparsers, parent_parser):
     )
     experiments_show_parser.add_argument(
         "--include-metrics",
-        action="append",
+        action=ExtendAction,
+        type=_parse_filter_list,
         default=[],
         help="Include the specified metrics in output table.",
         metavar="<metrics_list>",
     )
     experiments_show_parser.add_argument(
         "--exclude-metrics",
-        action="append",
+        action=ExtendAction,
+        type=_parse_filter_list,
         default=[],
         help="Exclude the specified metrics from output table.",
         metavar="<metrics_list>",
     )
     experiments_show_parser.add_argument(
         "--include-params",
-        action="append",
+        action=ExtendAction,
+        type=_parse_filter_list,
         default=[],
         help="Include the specified params in output table.",
         metavar="<params_list>",
     )
     experiments_show_parser.add_argument(
         "--exclude-params",
-        action="append",
+        action=ExtendAction,
+        type=_parse_filter_list,
         default=[],
         help="Exclude the specified params from output table.",
         metavar="<params_list>",
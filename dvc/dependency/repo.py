@@ -67,14 +67,16 @@ class RepoDependency(Dependency):
         from dvc.objects import save
         from dvc.repo.fetch import fetch_from_odb
 
-        for odb, objs in self.get_used_objs().items():
+        # NOTE: used objects and the staged object come from the same opened
+        # erepo, so there is no need to look the object up again
+        used, obj = self._get_used_and_obj()
+        for odb, objs in used.items():
             if isinstance(odb.fs, MemoryFileSystem):
-                for obj in objs:
-                    save(self.repo.odb.local, obj, jobs=jobs)
+                for used_obj in objs:
+                    save(self.repo.odb.local, used_obj, jobs=jobs)
             else:
                 fetch_from_odb(self.repo, odb, objs, jobs=jobs)
 
-        obj = self.get_obj()
         checkout(
             to.path_info,
             to.fs,
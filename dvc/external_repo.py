@@ -3,9 +3,10 @@ import os
 import tempfile
 import threading
 from contextlib import contextmanager
-from typing import Dict
+from functools import wraps
+from typing import TYPE_CHECKING, Dict
 
-from funcy import retry, wrap_with
+from funcy import retry
 
 from dvc.exceptions import (
     FileMissingError,
@@ -18,6 +19,9 @@ from dvc.exceptions import (
 from dvc.repo import Repo
 from dvc.utils import relpath
 
+if TYPE_CHECKING:
+    from dvc.scm.git import Git
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,9 +93,27 @@ def external_repo(
 
 CLONES: Dict[str, str] = {}
 CACHE_DIRS: Dict[str, str] = {}
+# NOTE: clones are re-checked/pulled for every erepo, so keep their Git
+# objects open instead of re-opening them each time. Closed in clean_repos.
+CLONE_GITS: Dict[str, "Git"] = {}
+
+
+def _locked_per_url(func):
+    """Serialize calls to func for the same url only, so that operations
+    on different repos don't block each other.
+    """
+    locks: Dict[str, threading.Lock] = {}
+
+    @wraps(func)
+    def wrapper(url, *args, **kwargs):
+        # NOTE: dict.setdefault is atomic, so no extra lock is needed here
+        with locks.setdefault(url, threading.Lock()):
+            return func(url, *args, **kwargs)
 
+    return wrapper
 
-@wrap_with(threading.Lock())
+
+@_locked_per_url
 def _get_cache_dir(url):
     try:
         cache_dir = CACHE_DIRS[url]
@@ -106,6 +128,11 @@ def clean_repos():
     CLONES.clear()
     CACHE_DIRS.clear()
 
+    gits = list(CLONE_GITS.values())
+    CLONE_GITS.clear()
+    for git in gits:
+        git.close()
+
     for path in paths:
         _remove(path)
 
@@ -141,7 +168,7 @@ def _cached_clone(url, rev, for_write=False):
     revision checked out. If for_write is set prevents reusing this dir via
     cache.
     """
-    from shutil import copytree
+    from dvc.utils.fs import copy_tree
 
     # even if we have already cloned this repo, we may need to
     # fetch/fast-forward to get specified rev
@@ -153,7 +180,7 @@ def _cached_clone(url, rev, for_write=False):
     # Copy to a new dir to keep the clone clean
     repo_path = tempfile.mkdtemp("dvc-erepo")
     logger.debug("erepo: making a copy of %s clone", url)
-    copytree(clone_path, repo_path)
+    copy_tree(clone_path, repo_path)
 
     # Check out the specified revision
     if for_write:
@@ -163,7 +190,7 @@ def _cached_clone(url, rev, for_write=False):
     return repo_path
 
 
-@wrap_with(threading.Lock())
+@_locked_per_url
 def _clone_default_branch(url, rev, for_write=False):
     """Get or create a clean clone of the url.
 
@@ -176,7 +203,7 @@ def _clone_default_branch(url, rev, for_write=False):
     git = None
     try:
         if clone_path:
-            git = Git(clone_path)
+            git = CLONE_GITS.pop(clone_path, None) or Git(clone_path)
             # Do not pull for known shas, branches and tags might move
             if not Git.is_sha(rev) or not git.has_rev(rev):
                 if shallow:
@@ -212,10 +239,13 @@ def _clone_default_branch(url, rev, for_write=False):
                 git = Git.clone(url, clone_path)
                 shallow = False
             CLONES[url] = (clone_path, shallow)
-    finally:
+    except Exception:
         if git:
             git.close()
+        raise
 
+    if git:
+        CLONE_GITS[clone_path] = git
     return clone_path, shallow
 
 
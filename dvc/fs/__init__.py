@@ -32,6 +32,12 @@ FS_MAP = {
 }
 
 
+def is_remote_path(path):
+    # NOTE: equivalent to `urlparse(path).scheme == "remote"`, but this is
+    # checked for every output on every DVC-file load, so avoid parsing.
+    return path[:7].lower() == "remote:"
+
+
 def get_fs_cls(remote_conf):
     scheme = urlparse(remote_conf["url"]).scheme
     return FS_MAP.get(scheme, LocalFileSystem)
@@ -68,10 +74,12 @@ def _resolve_remote_refs(config, remote_conf):
     #           "password": "asdf1234",
     #           "ask_password": False,
     #       }
-    parsed = urlparse(remote_conf["url"])
-    if parsed.scheme != "remote":
+    url = remote_conf["url"]
+    if not is_remote_path(url):
         return remote_conf
 
+    parsed = urlparse(url)
+
     base = get_fs_config(config, name=parsed.netloc)
     url = posixpath.join(base["url"], parsed.path.lstrip("/"))
     return {**base, **remote_conf, "url": url}
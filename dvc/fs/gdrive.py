@@ -94,6 +94,8 @@ class GDriveFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
     # Always prefer traverse for GDrive since API usage quotas are a concern.
     TRAVERSE_WEIGHT_MULTIPLIER = 1
     TRAVERSE_PREFIX_LEN = 2
+    # max number of parent ids OR-ed together in a single list query
+    LIST_QUERY_IDS_LIMIT = 100
 
     GDRIVE_CREDENTIALS_DATA = "GDRIVE_CREDENTIALS_DATA"
     DEFAULT_USER_CREDENTIALS_FILE = "gdrive-user-credentials.json"
@@ -322,6 +324,10 @@ class GDriveFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
             cache["dirs"][path].append(item_id)
             cache["ids"][item_id] = path
 
+    def _cache_dir_ids(self, path, item_ids):
+        if path not in self._ids_cache["dirs"]:
+            self._cache_path_id(path, *item_ids)
+
     @cached_property
     def _list_params(self):
         params = {"corpora": "default"}
@@ -506,6 +512,12 @@ class GDriveFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
 
         parent_path, title = posixpath.split(path)
         parent_ids = self._path_to_item_ids(parent_path, create, use_cache)
+        if use_cache and parent_ids and parent_path:
+            # NOTE: parents are always directories, remember them so that
+            # we don't have to resolve them part by part again for every
+            # other item inside of them.
+            self._cache_dir_ids(parent_path, parent_ids)
+
         item_ids = self._get_remote_item_ids(parent_ids, title)
         if item_ids:
             return item_ids
@@ -535,11 +547,16 @@ class GDriveFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
             return True
 
     def _gdrive_list_ids(self, query_ids):
-        query = " or ".join(
-            f"'{query_id}' in parents" for query_id in query_ids
-        )
-        query = f"({query}) and trashed=false"
-        return self._gdrive_list(query)
+        # NOTE: Drive rejects queries that are too long, e.g. when listing
+        # all of the 256 cache prefix dirs at once, so split them up.
+        query_ids = list(query_ids)
+        for i in range(0, len(query_ids), self.LIST_QUERY_IDS_LIMIT):
+            query = " or ".join(
+                f"'{query_id}' in parents"
+                for query_id in query_ids[i : i + self.LIST_QUERY_IDS_LIMIT]
+            )
+            query = f"({query}) and trashed=false"
+            yield from self._gdrive_list(query)
 
     def find(self, path_info, detail=False, prefix=None):
         root_path = path_info.path
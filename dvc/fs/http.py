@@ -4,21 +4,21 @@ import threading
 from typing import Optional
 from urllib.parse import urlparse
 
-from funcy import cached_property, memoize, wrap_prop, wrap_with
+from funcy import cached_property, wrap_prop
 
 from dvc import prompt
 from dvc.exceptions import DvcException, HTTPError
 from dvc.path_info import HTTPURLInfo
 from dvc.progress import Tqdm
 from dvc.scheme import Schemes
+from dvc.utils import memoize_locked
 
 from .base import BaseFileSystem
 
 logger = logging.getLogger(__name__)
 
 
-@wrap_with(threading.Lock())
-@memoize
+@memoize_locked
 def ask_password(host, user):
     return prompt.password(
         "Enter a password for "
@@ -3,14 +3,14 @@ import io
 import logging
 import os
 import shutil
-import threading
 from contextlib import closing, contextmanager
 
-from funcy import first, memoize, silent, wrap_with
+from funcy import first, silent
 
 from dvc import prompt
 from dvc.hash_info import HashInfo
 from dvc.scheme import Schemes
+from dvc.utils import memoize_locked
 
 from ..base import BaseFileSystem
 from ..pool import get_connection
@@ -18,8 +18,7 @@ from ..pool import get_connection
 logger = logging.getLogger(__name__)
 
 
-@wrap_with(threading.Lock())
-@memoize
+@memoize_locked
 def ask_password(host, user, port):
     return prompt.password(
         "Enter a private key passphrase or a password for "
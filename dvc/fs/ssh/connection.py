@@ -190,11 +190,12 @@ class SSHConnection:
             self._remove_file(path)
 
     def download(self, src, dest, no_progress_bar=False, progress_title=None):
+        # NOTE: sftp.get() stats the file anyway and passes its size to
+        # the callback, so don't spend an extra round-trip on getsize()
         with Tqdm(
             desc=progress_title or os.path.basename(src),
             disable=no_progress_bar,
             bytes=True,
-            total=self.getsize(src),
         ) as pbar:
             self.sftp.get(src, dest, callback=pbar.update_to)
 
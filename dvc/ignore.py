@@ -2,8 +2,11 @@ import logging
 import os
 import re
 from collections import namedtuple
+from functools import lru_cache
 from itertools import groupby, takewhile
+from typing import Set
 
+from funcy import cached_property
 from pathspec.patterns import GitWildMatchPattern
 from pathspec.util import normalize_file
 
@@ -12,8 +15,7 @@ from dvc.path_info import PathInfo
 from dvc.pathspec_math import PatternInfo, merge_patterns
 from dvc.scheme import Schemes
 from dvc.system import System
-from dvc.types import AnyPath, List, Optional
-from dvc.utils import relpath
+from dvc.types import AnyPath, Dict, List, Optional
 from dvc.utils.collections import PathStringTrie
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,37 @@ class DvcIgnore:
         raise NotImplementedError
 
 
+@lru_cache(maxsize=4096)
+def _pattern_to_regex(pattern):
+    # NOTE: the same patterns show up again and again after they are merged
+    # with the ones from the parent directories
+    return GitWildMatchPattern.pattern_to_regex(pattern)
+
+
+# NOTE: characters that make a pattern anything but a plain name
+_NON_LITERAL = frozenset("*?[]\\/!# \t")
+
+
+def _literal_name(pattern, regex):
+    """Return the name matched by a plain name pattern (e.g. `build` or
+    `build/`), which matches that name at any depth, and whether it only
+    matches directories. Return (None, False) for any other pattern.
+
+    The name is only trusted if pathspec compiles it to the same regex as
+    the pattern itself, so that escapes, trailing spaces or negations can't
+    make the set lookup disagree with the regex.
+    """
+    name = pattern.rstrip()
+    dir_only = name.endswith("/")
+    if dir_only:
+        name = name[:-1]
+    if name in ("", ".", "..") or any(char in name for char in _NON_LITERAL):
+        return None, False
+    if _pattern_to_regex(f"{name}/" if dir_only else name) != regex:
+        return None, False
+    return name, dir_only
+
+
 class DvcIgnorePatterns(DvcIgnore):
     def __init__(self, pattern_list, dirname):
         if pattern_list:
@@ -39,17 +72,48 @@ class DvcIgnorePatterns(DvcIgnore):
         self.prefix = self.dirname + os.sep
 
         self.regex_pattern_list = [
-            GitWildMatchPattern.pattern_to_regex(pattern_info.patterns)
+            _pattern_to_regex(pattern_info.patterns)
             for pattern_info in pattern_list
         ]
 
-        self.ignore_spec = [
-            (ignore, re.compile("|".join(item[0] for item in group)))
-            for ignore, group in groupby(
-                self.regex_pattern_list, lambda x: x[1]
-            )
+        # NOTE: without negated patterns the order of the patterns doesn't
+        # matter, so plain names (the most common patterns, including the
+        # default ones) are looked up in sets and only the rest is matched
+        # with the regex.
+        regex_patterns = self.regex_pattern_list
+        self.literals: Set[str] = set()
+        self.dir_literals: Set[str] = set()
+        if all(ignore is not False for _, ignore in regex_patterns):
+            regex_patterns = []
+            for pattern_info, item in zip(
+                pattern_list, self.regex_pattern_list
+            ):
+                name, dir_only = _literal_name(pattern_info.patterns, item)
+                if name is None:
+                    regex_patterns.append(item)
+                elif dir_only:
+                    self.dir_literals.add(name)
+                else:
+                    self.literals.add(name)
+
+        # NOTE: consecutive patterns of the same kind (ignore/unignore) are
+        # merged and all of them are fused into a single regex, with the
+        # last group first, as the last matching pattern wins. The named
+        # group that matched tells the priority and the kind of the match.
+        groups = [
+            (ignore, "|".join(item[0] for item in group))
+            for ignore, group in groupby(regex_patterns, lambda x: x[1])
             if ignore is not None
         ]
+        self.ignore_spec = {}
+        alternatives = []
+        for idx, (ignore, regex) in enumerate(reversed(groups)):
+            name = f"g{idx}"
+            self.ignore_spec[name] = (idx, ignore)
+            alternatives.append(f"(?P<{name}>{regex})")
+        self.ignore_regex = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
 
     @classmethod
     def from_file(cls, path, fs, name):
@@ -67,23 +131,42 @@ class DvcIgnorePatterns(DvcIgnore):
         return cls(path_spec_lines, dirname)
 
     def __call__(self, root: List[str], dirs: List[str], files: List[str]):
-        files = [f for f in files if not self.matches(root, f)]
-        dirs = [d for d in dirs if not self.matches(root, d, True)]
+        prefix = self._get_normalize_prefix(root)
+        if prefix is None or not self:
+            return dirs, files
+
+        # NOTE: the prefix is the same for all of the entries, so only the
+        # basename is joined and matched per entry.
+        normalize = None if System.is_unix() else normalize_file
+        ignore = self.ignore
+
+        def _keep(name, is_dir):
+            path = f"{prefix}{name}"
+            if normalize:
+                path = normalize(path)
+            return not ignore(path, is_dir)
+
+        files = [f for f in files if _keep(f, False)]
+        dirs = [d for d in dirs if _keep(d, True)]
 
         return dirs, files
 
-    def _get_normalize_path(self, dirname, basename):
+    def _get_normalize_prefix(self, dirname):
         # NOTE: `relpath` is too slow, so we have to assume that both
         # `dirname` and `self.dirname` are relative or absolute together.
         if dirname == self.dirname:
-            path = basename
-        elif dirname.startswith(self.prefix):
-            rel = dirname[len(self.prefix) :]
+            return ""
+        if dirname.startswith(self.prefix):
             # NOTE: `os.path.join` is ~x5.5 slower
-            path = f"{rel}{os.sep}{basename}"
-        else:
+            return f"{dirname[len(self.prefix) :]}{os.sep}"
+        return None
+
+    def _get_normalize_path(self, dirname, basename):
+        prefix = self._get_normalize_prefix(dirname)
+        if prefix is None:
             return False
 
+        path = f"{prefix}{basename}"
         if not System.is_unix():
             path = normalize_file(path)
         return path
@@ -98,33 +181,44 @@ class DvcIgnorePatterns(DvcIgnore):
         return self.ignore(path, is_dir)
 
     def ignore(self, path, is_dir):
-        def matches(pattern, path, is_dir) -> bool:
-            matches_ = bool(pattern.match(path))
+        if self.literals or self.dir_literals:
+            parts = path.split("/")
+            if not self.literals.isdisjoint(parts):
+                return True
+            if not self.dir_literals.isdisjoint(parts[:-1]) or (
+                is_dir and parts[-1] in self.dir_literals
+            ):
+                return True
+
+        if self.ignore_regex is None:
+            return False
 
-            if is_dir:
-                matches_ |= bool(pattern.match(f"{path}/"))
+        match = self.ignore_regex.match(path)
+        result = self.ignore_spec[match.lastgroup] if match else None
 
-            return matches_
+        if is_dir:
+            match = self.ignore_regex.match(f"{path}/")
+            if match:
+                dir_result = self.ignore_spec[match.lastgroup]
+                if result is None or dir_result < result:
+                    result = dir_result
 
-        result = False
+        return result[1] if result else False
 
-        for ignore, pattern in self.ignore_spec[::-1]:
-            if matches(pattern, path, is_dir):
-                result = ignore
-                break
-        return result
+    @cached_property
+    def _details_spec(self):
+        return [
+            (re.compile(regex), pattern_info)
+            for (regex, _), pattern_info in zip(
+                self.regex_pattern_list, self.pattern_list
+            )
+            # skip system pattern
+            if pattern_info.file_info
+        ]
 
     def _ignore_details(self, path, is_dir: bool):
         result = []
-        for (regex, _), pattern_info in list(
-            zip(self.regex_pattern_list, self.pattern_list)
-        ):
-            # skip system pattern
-            if not pattern_info.file_info:
-                continue
-
-            regex = re.compile(regex)
-
+        for regex, pattern_info in self._details_spec:
             matches = bool(regex.match(path))
             if is_dir:
                 matches |= bool(regex.match(f"{path}/"))
@@ -171,12 +265,21 @@ class DvcIgnoreFilter:
 
         self.fs = fs
         self.root_dir = root_dir
+        self._normed_root_dir = os.path.normcase(os.path.normpath(root_dir))
+        # NOTE: join adds a separator, unless root_dir is a drive/fs root
+        self._normed_root_prefix = os.path.join(self._normed_root_dir, "")
         self.ignores_trie_fs = PathStringTrie()
         self._ignores_trie_subrepos = PathStringTrie()
         self.ignores_trie_fs[root_dir] = DvcIgnorePatterns(
             default_ignore_patterns, root_dir
         )
         self._ignores_trie_subrepos[root_dir] = self.ignores_trie_fs[root_dir]
+        # NOTE: trie lookups walk the path component by component, so the
+        # resolved patterns are also cached per directory. Trie entries are
+        # final once `_get_trie_pattern` returns, so no invalidation needed.
+        self._patterns_cache: Dict[
+            bool, Dict[str, Optional["DvcIgnorePatterns"]]
+        ] = {True: {}, False: {}}
         self._update(
             self.root_dir,
             self._ignores_trie_subrepos,
@@ -190,12 +293,22 @@ class DvcIgnoreFilter:
             ignore_subrepos=True,
         )
 
-    def _update_trie(self, dirname: str, trie: PathStringTrie) -> None:
+    def _update_trie(
+        self,
+        dirname: str,
+        trie: PathStringTrie,
+        fnames: Optional["List"] = None,
+    ) -> None:
         old_pattern = trie.longest_prefix(dirname).value
         matches = old_pattern.matches(dirname, DvcIgnore.DVCIGNORE_FILE, False)
 
         path = os.path.join(dirname, DvcIgnore.DVCIGNORE_FILE)
-        if not matches and self.fs.exists(path):
+        if fnames is not None:
+            # NOTE: we are walking, so no need to stat the file
+            exists = DvcIgnore.DVCIGNORE_FILE in fnames
+        else:
+            exists = self.fs.exists(path)
+        if not matches and exists:
             name = os.path.relpath(path, self.root_dir)
             new_pattern = DvcIgnorePatterns.from_file(path, self.fs, name)
             if old_pattern:
@@ -218,21 +331,38 @@ class DvcIgnoreFilter:
         ignore_trie: PathStringTrie,
         dnames: Optional["List"],
         ignore_subrepos: bool,
+        fnames: Optional["List"] = None,
     ) -> None:
-        self._update_trie(dirname, ignore_trie)
+        self._update_trie(dirname, ignore_trie, fnames)
 
         if ignore_subrepos:
             if dnames is None:
-                try:
-                    _, dnames, _ = next(self.fs.walk(dirname))
-                except StopIteration:
-                    dnames = []
+                dnames = self._list_dirs(dirname)
 
             for dname in dnames:
                 self._update_sub_repo(
                     os.path.join(dirname, dname), ignore_trie
                 )
 
+    def _list_dirs(self, dirname: str) -> List[str]:
+        from dvc.fs.local import LocalFileSystem
+
+        # NOTE: git and repo filesystems report the local scheme too, but
+        # they need to list the revision's tree, not the working tree.
+        if not isinstance(self.fs, LocalFileSystem):
+            try:
+                _, dnames, _ = next(self.fs.walk(dirname))
+            except StopIteration:
+                dnames = []
+            return dnames
+
+        # NOTE: only the first level is needed, so don't set up a walk
+        try:
+            with os.scandir(dirname) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
     def _update_sub_repo(self, path, ignore_trie: PathStringTrie):
         from dvc.repo import Repo
 
@@ -262,7 +392,10 @@ class DvcIgnoreFilter:
     def __call__(self, root, dirs, files, ignore_subrepos=True):
         abs_root = os.path.abspath(root)
         ignore_pattern = self._get_trie_pattern(
-            abs_root, dnames=dirs, ignore_subrepos=ignore_subrepos
+            abs_root,
+            dnames=dirs,
+            ignore_subrepos=ignore_subrepos,
+            fnames=files,
         )
         if ignore_pattern:
             dirs, files = ignore_pattern(abs_root, dirs, files)
@@ -289,7 +422,30 @@ class DvcIgnoreFilter:
             yield from fs.walk_files(path_info)
 
     def _get_trie_pattern(
-        self, dirname, dnames: Optional["List"] = None, ignore_subrepos=True
+        self,
+        dirname,
+        dnames: Optional["List"] = None,
+        ignore_subrepos=True,
+        fnames: Optional["List"] = None,
+    ) -> Optional["DvcIgnorePatterns"]:
+        cache = self._patterns_cache[ignore_subrepos]
+        try:
+            return cache[dirname]
+        except KeyError:
+            pass
+
+        ignore_pattern = self._get_trie_pattern_uncached(
+            dirname, dnames, ignore_subrepos, fnames
+        )
+        cache[dirname] = ignore_pattern
+        return ignore_pattern
+
+    def _get_trie_pattern_uncached(
+        self,
+        dirname,
+        dnames: Optional["List"],
+        ignore_subrepos: bool,
+        fnames: Optional["List"],
     ) -> Optional["DvcIgnorePatterns"]:
         if ignore_subrepos:
             ignores_trie = self.ignores_trie_fs
@@ -312,10 +468,11 @@ class DvcIgnoreFilter:
             )
         )
         dirs.reverse()
-        dirs.append(dirname)
 
         for parent in dirs:
             self._update(parent, ignores_trie, dnames, ignore_subrepos)
+        # NOTE: the listing of files is only known for the dirname itself
+        self._update(dirname, ignores_trie, dnames, ignore_subrepos, fnames)
 
         return ignores_trie.get(dirname)
 
@@ -344,25 +501,21 @@ class DvcIgnoreFilter:
         return self._is_ignored(path, False)
 
     def _outside_repo(self, path):
-        path = PathInfo(path)
-
-        # paths outside of the repo should be ignored
-        path = relpath(path, self.root_dir)
-        if path.startswith("..") or (
-            os.name == "nt"
-            and not os.path.commonprefix(
-                [os.path.abspath(path), self.root_dir]
-            )
-        ):
-            return True
-        return False
+        # NOTE: `relpath` is too slow, and all of the paths here are absolute
+        # anyway, so just compare them to the normalized root as strings.
+        path = os.path.normcase(os.path.normpath(path))
+        return not (
+            path == self._normed_root_dir
+            or path.startswith(self._normed_root_prefix)
+        )
 
     def check_ignore(self, target):
         # NOTE: can only be used in `dvc check-ignore`, see
         # https://github.com/iterative/dvc/issues/5046
+        # NOTE: abspath is already normalized
         full_target = os.path.abspath(target)
         if not self._outside_repo(full_target):
-            dirname, basename = os.path.split(os.path.normpath(full_target))
+            dirname, basename = os.path.split(full_target)
             pattern = self._get_trie_pattern(dirname)
             if pattern:
                 matches = pattern.matches(
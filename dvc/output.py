@@ -3,7 +3,6 @@ import os
 from collections import defaultdict
 from copy import copy
 from typing import TYPE_CHECKING, Dict, Optional, Set, Type
-from urllib.parse import urlparse
 
 from funcy import collecting, project
 from voluptuous import And, Any, Coerce, Length, Lower, Required, SetTo
@@ -18,7 +17,7 @@ from dvc.exceptions import (
     RemoteCacheRequiredError,
 )
 
-from .fs import get_cloud_fs
+from .fs import get_cloud_fs, is_remote_path
 from .fs.hdfs import HDFSFileSystem
 from .fs.local import LocalFileSystem
 from .fs.s3 import S3FileSystem
@@ -333,8 +332,7 @@ class Output:
         if fs.scheme != "local":
             return path_info
 
-        parsed = urlparse(self.def_path)
-        if parsed.scheme != "remote":
+        if not is_remote_path(self.def_path):
             # NOTE: we can path either from command line or .dvc file,
             # so we should expect both posix and windows style paths.
             # PathInfo accepts both, i.e. / works everywhere, \ only on win.
@@ -358,7 +356,7 @@ class Output:
 
         if (
             not self.repo
-            or urlparse(self.def_path).scheme == "remote"
+            or is_remote_path(self.def_path)
             or os.path.isabs(self.def_path)
         ):
             return str(self.def_path)
@@ -378,7 +376,7 @@ class Output:
         if self.fs.scheme != "local":
             return False
 
-        if urlparse(self.def_path).scheme == "remote":
+        if is_remote_path(self.def_path):
             return False
 
         if os.path.isabs(self.def_path):
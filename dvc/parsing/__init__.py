@@ -1,6 +1,5 @@
 import logging
 from collections.abc import Mapping, Sequence
-from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -142,10 +141,14 @@ class DataResolver:
         vars_ = d.get(VARS_KWD, [])
         check_interpolations(vars_, VARS_KWD, self.relpath)
         self.context: Context = Context()
+        # params files that are already loaded, shared by all of the stages
+        self.vars_cache: Dict[Any, Context] = {}
 
         try:
             args = fs, vars_, wdir  # load from `vars` section
-            self.context.load_from_vars(*args, default=DEFAULT_PARAMS_FILE)
+            self.context.load_from_vars(
+                *args, default=DEFAULT_PARAMS_FILE, cache=self.vars_cache
+            )
         except ContextError as exc:
             format_and_raise(exc, "'vars'", self.relpath)
 
@@ -257,8 +260,10 @@ class EntryDefinition:
             # that itself. See `ForeachDefinition.do_definition`.
             check_syntax_errors(self.definition, name, self.relpath)
 
-        # we need to pop vars from generated/evaluated data
-        definition = deepcopy(self.definition)
+        # we need to pop vars from generated/evaluated data. A shallow copy
+        # is enough, as resolving builds new containers and never mutates
+        # the definition in-place.
+        definition = dict(self.definition)
 
         wdir = self._resolve_wdir(context, name, definition.get(WDIR_KWD))
         vars_ = definition.pop(VARS_KWD, [])
@@ -271,7 +276,13 @@ class EntryDefinition:
 
         try:
             fs = self.resolver.fs
-            context.load_from_vars(fs, vars_, wdir, stage_name=name)
+            context.load_from_vars(
+                fs,
+                vars_,
+                wdir,
+                stage_name=name,
+                cache=self.resolver.vars_cache,
+            )
         except VarsAlreadyLoaded as exc:
             format_and_raise(exc, f"'{self.where}.{name}.vars'", self.relpath)
 
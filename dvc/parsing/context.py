@@ -289,10 +289,12 @@ class CtxDict(Container, MutableMapping):
 
     def __deepcopy__(self, _):
         new = CtxDict()
-        for k, v in self.items():
-            new.data[k] = (
-                deepcopy(v) if isinstance(v, Container) else v
-            )  # short-circuiting __setitem__
+        # short-circuiting __setitem__ and the Mapping mixins, values are
+        # immutable so they can be shared, only containers need copying.
+        new.data = {
+            k: deepcopy(v) if isinstance(v, Container) else v
+            for k, v in self.data.items()
+        }
         return new
 
 
@@ -396,7 +398,14 @@ class Context(CtxDict):
             raise ReservedKeyError(matches)
         return super().merge_update(other, overwrite=overwrite)
 
-    def merge_from(self, fs, item: str, wdir: PathInfo, overwrite=False):
+    def merge_from(
+        self,
+        fs,
+        item: str,
+        wdir: PathInfo,
+        overwrite=False,
+        cache: Dict[Any, "Context"] = None,
+    ):
         path, _, keys_str = item.partition(":")
         select_keys = lfilter(bool, keys_str.split(",")) if keys_str else None
 
@@ -407,7 +416,15 @@ class Context(CtxDict):
                 return  # allow specifying complete filepath multiple times
             self.check_loaded(abspath, item, select_keys)
 
-        ctx = Context.load_from(fs, path_info, select_keys)
+        if cache is None:
+            ctx = Context.load_from(fs, path_info, select_keys)
+        else:
+            key = (abspath, tuple(select_keys) if select_keys else None)
+            if key not in cache:
+                cache[key] = Context.load_from(fs, path_info, select_keys)
+            # NOTE: merge_update() shares the nodes, so don't hand out
+            # the cached context itself
+            ctx = Context.clone(cache[key])
 
         try:
             self.merge_update(ctx, overwrite=overwrite)
@@ -442,11 +459,17 @@ class Context(CtxDict):
         wdir: PathInfo,
         stage_name: str = None,
         default: str = None,
+        cache: Dict[Any, "Context"] = None,
     ):
+        """Load `vars_` into the context.
+
+        Files loaded through the same `cache` dict are only read and parsed
+        once, which helps when many stages share the same params files.
+        """
         if default:
             to_import = wdir / default
             if fs.exists(to_import):
-                self.merge_from(fs, default, wdir)
+                self.merge_from(fs, default, wdir, cache=cache)
             else:
                 msg = "%s does not exist, it won't be used in parametrization"
                 logger.trace(msg, to_import)  # type: ignore[attr-defined]
@@ -455,7 +478,7 @@ class Context(CtxDict):
         for index, item in enumerate(vars_):
             assert isinstance(item, (str, dict))
             if isinstance(item, str):
-                self.merge_from(fs, item, wdir)
+                self.merge_from(fs, item, wdir, cache=cache)
             else:
                 joiner = "." if stage_name else ""
                 meta = Meta(source=f"{stage_name}{joiner}vars[{index}]")
@@ -1,7 +1,7 @@
 import re
 import typing
 from collections.abc import Mapping
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 from funcy import memoize, rpartial
 
@@ -50,8 +50,13 @@ class ParseError(DvcException):
     pass
 
 
+@lru_cache(maxsize=4096)
+def _find_matches(template: str):
+    return tuple(KEYCRE.finditer(template))
+
+
 def get_matches(template: str):
-    return list(KEYCRE.finditer(template))
+    return list(_find_matches(template))
 
 
 def is_interpolated_string(val):
@@ -129,7 +134,12 @@ def check_expression(s: str):
         get_expression(match)
 
 
-def parse_expr(s: str):
+# NOTE: the same expressions are used again and again in every stage
+# (especially in foreach), and pyparsing is slow, so parse them only once.
+# The cached tokens are shared by every caller, so they are kept as an
+# immutable tuple rather than pyparsing's mutable ParseResults.
+@lru_cache(maxsize=4096)
+def _parse_tokens(s: str) -> tuple:
     from pyparsing import ParseException
 
     try:
@@ -138,7 +148,11 @@ def parse_expr(s: str):
         format_and_raise_parse_error(exc)
         raise AssertionError("unreachable")
 
-    joined = result.asList()
+    return tuple(result.asList())
+
+
+def parse_expr(s: str):
+    joined = _parse_tokens(s)
     assert len(joined) == 1
     return joined[0]
 
@@ -28,12 +28,12 @@ def _fspath_dir(path):
 
 
 def _remove_unused_links(repo):
-    used = [
+    used = {
         out.fspath
         for stage in repo.stages
         for out in stage.outs
         if out.scheme == "local"
-    ]
+    }
 
     unused = repo.state.get_unused_links(used, repo.fs)
     ret = [_fspath_dir(u) for u in unused]
@@ -30,6 +30,15 @@ def diff(self, a_rev="HEAD", b_rev=None, targets=None):
 
     a_rev = fix_exp_head(self.scm, a_rev)
     b_rev = fix_exp_head(self.scm, b_rev) if b_rev else "workspace"
+    if (
+        targets is None
+        and b_rev != "workspace"
+        and self.scm.resolve_rev(a_rev) == self.scm.resolve_rev(b_rev)
+    ):
+        # same commit, nothing to compare. With targets, we still need to
+        # go through them to report the missing ones.
+        return {}
+
     results = {}
     missing_targets = {}
     for rev in self.brancher(revs=[a_rev, b_rev]):
@@ -58,17 +67,15 @@ def diff(self, a_rev="HEAD", b_rev=None, targets=None):
     new = results[b_rev]
 
     # Compare paths between the old and new fs.
-    # set() efficiently converts dict keys to a set
-    added = sorted(set(new) - set(old))
-    deleted_or_missing = set(old) - set(new)
+    added, deleted_or_missing, modified = _compare_paths(old, new)
     if b_rev == "workspace":
         # missing status is only applicable when diffing local workspace
         # against a commit
-        missing = sorted(_filter_missing(repo_fs, deleted_or_missing))
+        missing = list(_filter_missing(repo_fs, deleted_or_missing))
     else:
         missing = []
-    deleted = sorted(deleted_or_missing - set(missing))
-    modified = sorted(set(old) & set(new))
+    missing_set = set(missing)
+    deleted = [path for path in deleted_or_missing if path not in missing_set]
 
     # Cases when file was changed and renamed are resulted
     # in having deleted and added record
@@ -98,6 +105,33 @@ def diff(self, a_rev="HEAD", b_rev=None, targets=None):
     return ret if any(ret.values()) else {}
 
 
+def _compare_paths(old, new):
+    """Merge-join sorted paths of both revisions in a single pass.
+
+    Returns sorted lists of (added, deleted, common) paths.
+    """
+    old_paths = sorted(old)
+    new_paths = sorted(new)
+    added, deleted, common = [], [], []
+
+    i = j = 0
+    while i < len(old_paths) and j < len(new_paths):
+        old_path, new_path = old_paths[i], new_paths[j]
+        if old_path == new_path:
+            common.append(old_path)
+            i += 1
+            j += 1
+        elif old_path < new_path:
+            deleted.append(old_path)
+            i += 1
+        else:
+            added.append(new_path)
+            j += 1
+    deleted.extend(old_paths[i:])
+    added.extend(new_paths[j:])
+    return added, deleted, common
+
+
 def _paths_checksums(repo, repo_fs, targets):
     """
     A dictionary of checksums addressed by relpaths collected from
@@ -152,19 +186,64 @@ def _output_paths(repo, repo_fs, targets):
                     yield_output
                     or any(target.isin(output.path_info) for target in targets)
                 ):
-                    yield from _dir_output_paths(repo_fs, output, targets)
+                    if on_working_fs:
+                        yield from _dir_output_paths(
+                            repo_fs, output, targets, state=repo.state
+                        )
+                    else:
+                        yield from _dir_manifest_paths(
+                            repo_fs, output, targets
+                        )
+
+
+def _dir_manifest_paths(repo_fs, output, targets=None):
+    """Collect file hashes of a committed dir output from its `.dir`
+    manifest, if it is in the cache, instead of walking it.
+    """
+    from dvc.objects.errors import ObjectFormatError
+
+    try:
+        obj = output.get_obj()
+    except ObjectFormatError:
+        obj = None
+
+    if obj is None:
+        yield from _dir_output_paths(repo_fs, output, targets)
+        return
+
+    for key, entry_obj in obj:
+        fname = output.path_info.joinpath(*key)
+        if targets is None or any(
+            fname.isin_or_eq(target) for target in targets
+        ):
+            yield str(fname), entry_obj.hash_info.value
+
 
+def _dir_output_paths(repo_fs, output, targets=None, state=None):
+    from concurrent.futures import ThreadPoolExecutor
 
-def _dir_output_paths(repo_fs, output, targets=None):
     from dvc.config import NoRemoteError
 
+    def _to_checksum(fname):
+        fs = repo_fs
+        if state is not None and output.fs.exists(fname):
+            # NOTE: workspace files go through the state db, so that
+            # unchanged files don't get rehashed on every diff.
+            fs = output.fs
+        # pylint: disable=no-member
+        hash_info = get_file_hash(fname, fs, "md5", state=state)
+        return str(fname), hash_info.value
+
     try:
-        for fname in repo_fs.walk_files(output.path_info):
-            if targets is None or any(
-                fname.isin_or_eq(target) for target in targets
-            ):
-                # pylint: disable=no-member
-                yield str(fname), get_file_hash(fname, repo_fs, "md5").value
+        fnames = [
+            fname
+            for fname in repo_fs.walk_files(output.path_info)
+            if targets is None
+            or any(fname.isin_or_eq(target) for target in targets)
+        ]
+        # NOTE: hashing files that are not in the cache yet is I/O bound
+        with ThreadPoolExecutor(max_workers=repo_fs.hash_jobs) as executor:
+            yield from executor.map(_to_checksum, fnames)
     except NoRemoteError:
         logger.warning("dir cache entry for '%s' is missing", output)
 
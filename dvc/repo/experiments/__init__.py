@@ -640,6 +640,7 @@ class Experiments:
                 branch=item.branch,
                 tmp_dir=base_tmp_dir,
                 cache_dir=self.repo.odb.local.cache_dir,
+                cache_types=self.repo.odb.local.cache_types,
             )
             executors[stash_rev] = executor
 
@@ -847,11 +848,9 @@ class Experiments:
     def _get_baseline(self, rev):
         rev = self.scm.resolve_rev(rev)
 
-        if rev in self.stash_revs:
-            entry = self.stash_revs.get(rev)
-            if entry:
-                return entry.baseline_rev
-            return None
+        stash_revs = self.stash_revs
+        if rev in stash_revs:
+            return stash_revs[rev].baseline_rev
 
         ref_info = first(exp_refs_by_rev(self.scm, rev))
         if ref_info:
@@ -37,7 +37,7 @@ from dvc.stage import PipelineStage
 from dvc.stage.monitor import CheckpointKilledError
 from dvc.stage.serialize import to_lockfile
 from dvc.utils import dict_sha256
-from dvc.utils.fs import remove
+from dvc.utils.fs import chdir, remove
 
 if TYPE_CHECKING:
     from multiprocessing import Queue
@@ -121,9 +121,7 @@ class BaseExecutor(ABC):
 
         DulwichRepo.init(os.fspath(self.root_dir))
 
-        cwd = os.getcwd()
-        os.chdir(self.root_dir)
-        try:
+        with chdir(self.root_dir):
             refspec = f"{EXEC_NAMESPACE}/"
             scm.push_refspec(self.git_url, refspec, refspec)
             if branch:
@@ -141,8 +139,6 @@ class BaseExecutor(ABC):
             self.scm.checkout(head, detach=True)
             merge_rev = self.scm.get_ref(EXEC_MERGE)
             self.scm.merge(merge_rev, squash=True, commit=False)
-        finally:
-            os.chdir(cwd)
 
     @cached_property
     def scm(self):
@@ -399,26 +395,28 @@ class BaseExecutor(ABC):
         dvc = Repo(dvc_dir)
         if cls.QUIET:
             dvc.scm.quiet = cls.QUIET
-        if dvc_dir is not None:
-            old_cwd: Optional[str] = os.getcwd()
-            if rel_cwd:
-                os.chdir(os.path.join(dvc.root_dir, rel_cwd))
-            else:
-                os.chdir(dvc.root_dir)
-        else:
-            old_cwd = None
-        if pidfile is not None:
-            info = ExecutorInfo(
-                os.getpid(),
-                git_url,
-                dvc.scm.get_rev(),
-                cls.DEFAULT_LOCATION,
-            )
-            with modify_yaml(pidfile) as d:
-                d.update(info.to_dict())
-        logger.debug("Running repro in '%s'", os.getcwd())
+        old_cwd: Optional[str] = None
 
+        # NOTE: everything after changing the directory has to be inside of
+        # `try`, so that the original cwd is restored on any failure.
         try:
+            if dvc_dir is not None:
+                old_cwd = os.getcwd()
+                if rel_cwd:
+                    os.chdir(os.path.join(dvc.root_dir, rel_cwd))
+                else:
+                    os.chdir(dvc.root_dir)
+            if pidfile is not None:
+                info = ExecutorInfo(
+                    os.getpid(),
+                    git_url,
+                    dvc.scm.get_rev(),
+                    cls.DEFAULT_LOCATION,
+                )
+                with modify_yaml(pidfile) as d:
+                    d.update(info.to_dict())
+            logger.debug("Running repro in '%s'", os.getcwd())
+
             yield dvc
         except CheckpointKilledError:
             raise
@@ -1,7 +1,7 @@
 import logging
 import os
 from tempfile import TemporaryDirectory
-from typing import Optional
+from typing import List, Optional
 
 from .base import BaseExecutor
 
@@ -52,20 +52,27 @@ class TempDirExecutor(BaseLocalExecutor):
         *args,
         tmp_dir: Optional[str] = None,
         cache_dir: Optional[str] = None,
+        cache_types: Optional[List[str]] = None,
         **kwargs,
     ):
         self._tmp_dir = ExpTemporaryDirectory(dir=tmp_dir)
         kwargs["root_dir"] = self._tmp_dir.name
         super().__init__(*args, **kwargs)
         if cache_dir:
-            self._config(cache_dir)
+            self._config(cache_dir, cache_types)
         logger.debug("Init temp dir executor in dir '%s'", self._tmp_dir)
 
-    def _config(self, cache_dir):
+    def _config(self, cache_dir, cache_types=None):
         local_config = os.path.join(self.dvc_dir, "config.local")
         logger.debug("Writing experiments local config '%s'", local_config)
+        lines = ["[cache]", f"    dir = {cache_dir}"]
+        if cache_types:
+            # NOTE: use the same link types as the workspace (which may
+            # only be set in its config.local), so that data is linked
+            # from the shared cache instead of being copied.
+            lines.append(f"    type = {','.join(cache_types)}")
         with open(local_config, "w") as fobj:
-            fobj.write(f"[cache]\n    dir = {cache_dir}")
+            fobj.write("\n".join(lines))
 
     def cleanup(self):
         super().cleanup()
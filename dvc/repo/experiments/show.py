@@ -68,7 +68,8 @@ def _collect_experiment_branch(res, repo, branch, baseline, **kwargs):
     prev = None
     revs = list(repo.scm.branch_revs(exp_rev, baseline))
     for rev in revs:
-        collected_exp = _collect_experiment_commit(repo, rev, **kwargs)
+        # NOTE: checkpoint branches share their history, so commits that
+        # were already collected for another branch are not collected again
         if len(revs) > 1:
             exp = {"checkpoint_tip": exp_rev}
             if prev:
@@ -77,9 +78,9 @@ def _collect_experiment_branch(res, repo, branch, baseline, **kwargs):
                 res[rev].update(exp)
                 res.move_to_end(rev)
             else:
-                exp.update(collected_exp)
-        else:
-            exp = collected_exp
+                exp.update(_collect_experiment_commit(repo, rev, **kwargs))
+        elif rev not in res:
+            exp = _collect_experiment_commit(repo, rev, **kwargs)
         if rev not in res:
             res[rev] = exp
         prev = rev
@@ -113,9 +114,8 @@ def show(
             except SCMError:
                 break
 
-    revs = OrderedDict(
-        (rev, None)
-        for rev in repo.brancher(
+    revs = dict.fromkeys(
+        repo.brancher(
             revs=revs,
             all_branches=all_branches,
             all_tags=all_tags,
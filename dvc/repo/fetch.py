@@ -134,19 +134,31 @@ def fetch_from_odb(repo, odb, objs, **kwargs):
 
 
 def _fetch_external(repo, objs, **kwargs):
+    from concurrent.futures import ThreadPoolExecutor
+
     from dvc.objects import save
     from dvc.objects.errors import ObjectError
+    from dvc.objects.tree import Tree
 
     results = []
-    failed = 0
 
     def callback(result):
         results.append(result)
 
-    for obj in objs:
+    def _save(obj):
         try:
             save(repo.odb.local, obj, download_callback=callback, **kwargs)
         except ObjectError:
-            failed += 1
+            return 1
+        return 0
+
+    # NOTE: trees are already saved file by file in parallel, so only
+    # separate file objects are saved concurrently here.
+    trees = [obj for obj in objs if isinstance(obj, Tree)]
+    files = [obj for obj in objs if not isinstance(obj, Tree)]
+
+    failed = sum(map(_save, trees))
+    with ThreadPoolExecutor(max_workers=kwargs.get("jobs")) as executor:
+        failed += sum(executor.map(_save, files))
 
     return sum(results), failed
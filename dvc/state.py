@@ -172,7 +172,7 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
         """Removes all saved links except the ones that are used.
 
         Args:
-            used (list): list of used links that should not be removed.
+            used (set): set of used links that should not be removed.
         """
         if not isinstance(fs, LocalFileSystem):
             return
@@ -117,8 +117,19 @@ def rich_table(
         console.print(table)
         return
 
-    from dvc.utils.pager import DvcPager
+    from rich.console import Console as RichConsole
+
+    from dvc.utils.pager import pager_pipe
 
     with console_width(table, console, SHOW_MAX_WIDTH):
-        with console.pager(pager=DvcPager(), styles=True):
-            console.print(table)
+        width = console.width
+
+    # NOTE: render straight into the pager instead of capturing the whole
+    # table in memory first, keeping the same styling as the main console.
+    with pager_pipe() as stream:
+        RichConsole(
+            file=stream,
+            width=width,
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+        ).print(table)
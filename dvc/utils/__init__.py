@@ -8,7 +8,9 @@ import os
 import re
 import stat
 import sys
+import threading
 import time
+from functools import wraps
 from typing import Optional, Tuple
 
 import colorama
@@ -214,6 +216,30 @@ def fix_env(env=None):
     return env
 
 
+def memoize_locked(func):
+    """Like `funcy.memoize`, but calls to `func` are serialized, e.g. not to
+    prompt the user for the same thing twice. Unlike wrapping memoize with
+    a lock, cached results are returned without taking the lock.
+    """
+    memory = {}
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            return memory[args]
+        except KeyError:
+            pass
+
+        with lock:
+            if args not in memory:
+                memory[args] = func(*args)
+            return memory[args]
+
+    wrapper.memory = memory  # type: ignore[attr-defined]
+    return wrapper
+
+
 def tmp_fname(fname=""):
     """Temporary name for a partial download"""
     from shortuuid import uuid
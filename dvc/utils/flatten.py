@@ -1,7 +1,25 @@
 def flatten(d):
-    import flatten_dict
+    """Flatten nested dicts into a single dict with dot-joined keys.
 
-    return flatten_dict.flatten(d, reducer="dot")
+    Nested dicts are walked depth-first with an explicit stack, keeping
+    the insertion order of the keys and skipping empty dicts. Raises
+    ValueError if different paths end up with the same joined key.
+    """
+    ret = {}
+    stack = [(None, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, val in items:
+            name = key if prefix is None else f"{prefix}.{key}"
+            if isinstance(val, dict):
+                stack.append((name, iter(val.items())))
+                break
+            if name in ret:
+                raise ValueError(f"duplicated key '{name}'")
+            ret[name] = val
+        else:
+            stack.pop()
+    return ret
 
 
 def unflatten(d):
@@ -4,6 +4,7 @@ import os
 import shutil
 import stat
 import sys
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from dvc.exceptions import DvcException
@@ -148,6 +149,17 @@ def remove(path):
             raise
 
 
+@contextmanager
+def chdir(path: "StrPath"):
+    """Change the working directory for the duration of the context."""
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
 def path_isin(child: "StrPath", parent: "StrPath"):
     """Check if given `child` path is inside `parent`."""
 
@@ -207,6 +219,12 @@ def copyfile(src, dest, no_progress_bar=False, name=None):
     try:
         System.reflink(src, dest)
     except DvcException:
+        if no_progress_bar or total < LOCAL_CHUNK_SIZE:
+            # NOTE: nothing to report progress on, let shutil use the
+            # fast in-kernel copy (sendfile/fcopyfile) where available.
+            shutil.copyfile(src, dest)
+            return
+
         with open(src, "rb") as fsrc, open(dest, "wb+") as fdest:
             with Tqdm.wrapattr(
                 fdest,
@@ -229,6 +247,58 @@ def copy_fobj_to_file(fsrc, dest):
         shutil.copyfileobj(fsrc, fdest)
 
 
+def copy_tree(src, dest, jobs=None):
+    """Copy directory tree, copying the files in parallel.
+
+    Directories are created upfront in a single walk, symlinks are
+    copied as symlinks and `dest` is allowed to exist already. Files are
+    reflinked when the filesystem supports it.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    files = []
+    for root, dirs, fnames in os.walk(src):
+        dest_root = os.path.join(dest, os.path.relpath(root, src))
+        os.makedirs(dest_root, exist_ok=True)
+        for dname in dirs:
+            src_path = os.path.join(root, dname)
+            if os.path.islink(src_path):
+                # NOTE: os.walk doesn't follow them, so copy them as files
+                fnames.append(dname)
+            else:
+                os.makedirs(os.path.join(dest_root, dname), exist_ok=True)
+        files.extend(
+            (os.path.join(root, fname), os.path.join(dest_root, fname))
+            for fname in fnames
+        )
+
+    use_reflink = True
+
+    def _copy(args):
+        nonlocal use_reflink
+
+        src_path, dest_path = args
+        if os.path.islink(src_path):
+            os.symlink(os.readlink(src_path), dest_path)
+            return
+
+        if use_reflink:
+            try:
+                System.reflink(src_path, dest_path)
+                shutil.copystat(src_path, dest_path)
+                return
+            except DvcException:
+                # NOTE: most likely not supported by this filesystem,
+                # don't bother trying it for the rest of the files
+                use_reflink = False
+        shutil.copy2(src_path, dest_path)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # NOTE: consume the results to propagate the errors
+        for _ in executor.map(_copy, files):
+            pass
+
+
 def walk_files(directory):
     for root, _, files in os.walk(directory):
         for f in files:
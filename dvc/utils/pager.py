@@ -1,11 +1,12 @@
 """Draws DAG in ASCII."""
 
+import io
 import logging
 import os
 import pydoc
 import sys
-
-from rich.pager import Pager
+from contextlib import contextmanager
+from typing import Iterator, TextIO
 
 from dvc.env import DVC_PAGER
 from dvc.utils import format_link
@@ -90,6 +91,31 @@ def pager(text: str) -> None:
     make_pager(_pager)(text)
 
 
-class DvcPager(Pager):
-    def show(self, content: str) -> None:
-        pager(content)
+@contextmanager
+def pager_pipe() -> Iterator[TextIO]:
+    """Open a pipe to the pager, so that the output could be streamed into
+    it as it is being rendered, instead of being collected in memory first.
+
+    Falls back to stdout if there is no pager to use.
+    """
+    import subprocess
+
+    _pager = find_pager()
+    logger.trace(f"Using pager: '{_pager}'")  # type: ignore[attr-defined]
+    if not _pager:
+        yield sys.stdout
+        return
+
+    proc = subprocess.Popen(_pager, shell=True, stdin=subprocess.PIPE)
+    try:
+        with io.TextIOWrapper(proc.stdin, errors="backslashreplace") as pipe:
+            yield pipe
+    except BrokenPipeError:
+        pass  # the pager was quit before reading all of the output
+    finally:
+        while True:
+            try:
+                proc.wait()
+                break
+            except KeyboardInterrupt:
+                pass
@@ -1,2 +1,7 @@
+from PyInstaller.utils.hooks import collect_submodules
+
 # https://github.com/pypa/setuptools/issues/1963
 hiddenimports = ["pkg_resources.py2_warn"]
+
+# NOTE: command modules are imported dynamically by dvc.cli
+hiddenimports.extend(collect_submodules("dvc.command"))
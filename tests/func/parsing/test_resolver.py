@@ -189,3 +189,23 @@ def test_local_overwrite_error(tmp_dir, dvc, vars_, loc):
         f"cannot redefine 'models.bar' from '{loc}' "
         "as it already exists in 'params.yaml'"
     )
+
+
+def test_resolve_does_not_mutate_definition(tmp_dir, dvc):
+    dump_yaml(DEFAULT_PARAMS_FILE, DATA)
+    d = {
+        "stages": {
+            "build": {
+                "cmd": "echo ${models.foo}",
+                "outs": ["${models.bar}"],
+                "vars": [{"foo": "foo"}],
+            }
+        }
+    }
+    original = deepcopy(d)
+
+    resolver = DataResolver(dvc, tmp_dir, d)
+    assert resolver.resolve() == {
+        "stages": {"build": {"cmd": "echo foo", "outs": ["bar"]}}
+    }
+    assert d == original
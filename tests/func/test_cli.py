@@ -1,5 +1,7 @@
 import os
 
+import pytest
+
 from dvc.cli import parse_args
 from dvc.command.add import CmdAdd
 from dvc.command.base import CmdBase
@@ -261,3 +263,56 @@ def test_unknown_subcommand_help(capsys):
     captured = capsys.readouterr()
     help_output = captured.out
     assert output == help_output
+
+
+def test_main_parser_builds_only_invoked_command():
+    from dvc.cli import _find_commands, get_main_parser
+
+    assert _find_commands(["--cd", "add", "push", "-v"]) == (
+        "dvc.command.data_sync",
+    )
+    assert _find_commands(["-v", "exp", "show"]) == (
+        "dvc.command.experiments",
+    )
+    assert _find_commands(["-V"]) == ()
+    assert _find_commands(["--help", "add"]) is None
+    assert _find_commands(["unknown"]) is None
+    assert _find_commands([]) is None
+
+    parser = get_main_parser(("dvc.command.add",))
+    subparsers = parser._subparsers._group_actions[0]
+    assert list(subparsers.choices) == ["add"]
+
+    subparsers = get_main_parser()._subparsers._group_actions[0]
+    assert {"add", "push", "exp", "doctor"} <= set(subparsers.choices)
+
+
+def test_main_parser_is_cached():
+    from dvc.cli import get_main_parser
+
+    assert get_main_parser() is get_main_parser()
+    assert parse_args(["add", "foo"]).targets == ["foo"]
+    assert parse_args(["add", "bar"]).targets == ["bar"]
+
+
+def test_find_parser_by_func(capsys):
+    from dvc.cli import get_main_parser
+    from dvc.command.plots import CmdPlotsDiff
+
+    parser = get_main_parser()
+    with pytest.raises(DvcParserError):
+        parser.error("bad", CmdPlotsDiff)
+    output = capsys.readouterr().out
+    assert output.startswith("usage: dvc plots diff")
+
+
+def test_parse_args_from_iterator():
+    args = parse_args(iter(["add", "foo"]))
+    assert args.targets == ["foo"]
+
+
+def test_command_modules_cover_all_commands():
+    from dvc.cli import COMMAND_MODULES, get_main_parser
+
+    subparsers = get_main_parser()._subparsers._group_actions[0]
+    assert set(subparsers.choices) == set(COMMAND_MODULES)
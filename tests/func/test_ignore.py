@@ -183,6 +183,17 @@ def test_ignore_subrepo(tmp_dir, scm, dvc):
         assert subrepo.fs.exists(subrepo_dir / "foo")
 
 
+def test_ignore_subrepo_dirs_on_git_fs(tmp_dir, scm, dvc):
+    tmp_dir.scm_gen({"dir": {"sub": {"foo": "foo"}}}, commit="add dir")
+    shutil.rmtree(tmp_dir / "dir" / "sub")
+    tmp_dir.gen({"dir": {"other": {"bar": "bar"}}})
+
+    dirname = os.fspath(tmp_dir / "dir")
+    for rev in dvc.brancher(revs=["HEAD"]):
+        expected = ["other"] if rev == "workspace" else ["sub"]
+        assert dvc.dvcignore._list_dirs(dirname) == expected
+
+
 def test_ignore_resurface_subrepo(tmp_dir, scm, dvc):
     tmp_dir.dvc_gen({"foo": "foo"}, commit="add foo")
     subrepo_dir = tmp_dir / "subdir"
@@ -90,6 +90,30 @@ def test_experiments_show(dvc, scm, mocker):
     )
 
 
+def test_experiments_show_filter_lists():
+    cli_args = parse_args(
+        [
+            "exp",
+            "show",
+            "--include-metrics",
+            "metrics.json:foo,bar",
+            "--include-metrics",
+            "baz",
+            "--exclude-params",
+            "lr,epochs",
+        ]
+    )
+    assert cli_args.include_metrics == [
+        "metrics.json:foo",
+        "metrics.json:bar",
+        "baz",
+    ]
+    assert cli_args.exclude_params == ["lr", "epochs"]
+    assert cli_args.exclude_metrics == []
+
+    assert parse_args(["exp", "show"]).include_metrics == []
+
+
 def test_experiments_run(dvc, scm, mocker):
     default_arguments = {
         "params": [],
@@ -1,6 +1,8 @@
+import os
+
 import pytest
 
-from dvc.fs import get_fs_cls
+from dvc.fs import get_fs_cls, is_remote_path
 from dvc.fs.hdfs import HDFSFileSystem
 from dvc.fs.http import HTTPFileSystem
 from dvc.fs.https import HTTPSFileSystem
@@ -29,3 +31,17 @@ from dvc.fs.ssh import SSHFileSystem
 )
 def test_get_fs_cls(url, cls):
     assert get_fs_cls({"url": url}) == cls
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("remote://myremote/path", True),
+        ("REMOTE://myremote/path", True),
+        ("data/remote/path", False),
+        (os.path.join("remote", "path"), False),
+        ("https://example.com/remote", False),
+    ],
+)
+def test_is_remote_path(path, expected):
+    assert is_remote_path(path) == expected
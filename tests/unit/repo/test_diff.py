@@ -0,0 +1,14 @@
+from dvc.repo.diff import _compare_paths
+
+
+def test_compare_paths():
+    old = {"a": "1", "b": "2", "dir/": "3", "dir/x": "4"}
+    new = {"b": "2", "c": "5", "dir/": "6", "dir/y": "7"}
+
+    assert _compare_paths(old, new) == (
+        ["c", "dir/y"],
+        ["a", "dir/x"],
+        ["b", "dir/"],
+    )
+    assert _compare_paths({}, new) == (sorted(new), [], [])
+    assert _compare_paths(old, {}) == ([], sorted(old), [])
@@ -1,3 +1,4 @@
+import os
 from dataclasses import asdict
 from math import pi
 from unittest.mock import mock_open
@@ -442,3 +443,20 @@ def test_load_from_raises_if_file_is_directory(tmp_dir, dvc):
         Context.load_from(dvc.fs, data_dir)
 
     assert str(exc_info.value) == "'data' is a directory"
+
+
+def test_load_from_vars_cache(tmp_dir, mocker):
+    fs = LocalFileSystem()
+    dump_yaml(tmp_dir / "params.yaml", {"foo": "foo", "bar": "bar"}, fs)
+    load_from = mocker.spy(Context, "load_from")
+
+    cache = {}
+    c1 = Context()
+    c1.load_from_vars(fs, ["params.yaml"], tmp_dir, cache=cache)
+    c2 = Context()
+    c2.load_from_vars(fs, ["params.yaml"], tmp_dir, cache=cache)
+    assert load_from.call_count == 1
+
+    c1["foo"] = "changed"
+    assert c2["foo"] == Value("foo")
+    assert c2.imports == {os.path.abspath(tmp_dir / "params.yaml"): None}
@@ -39,6 +39,8 @@ def mock_dvcignore(dvcignore_path, patterns):
         ("to_ignore.txt", ["to_ignore*"], True),
         ("to_ignore.txt", ["to_ignore*", "!to_ignore.txt"], False),
         ("to_ignore.txt", ["!to_ignore.txt", "to_ignore*"], True),
+        ("to_ignore", ["to_ignore", "!to_ignore"], False),
+        (os.path.join("dir", "to_ignore"), ["dir", "!to_ignore"], True),
         # It is not possible to re-include a file if a parent directory of
         # that file is excluded.
         # Git doesn’t list excluded directories for performance reasons,
@@ -209,3 +211,60 @@ def test_should_ignore_dir(omit_dir, sub_dir):
 
     assert set(new_dirs) == {"dir1", "dir2"}
     assert set(new_files) == {"file1", "file2", omit_dir}
+
+
+def test_literal_patterns():
+    ignore = DvcIgnorePatterns(["foo", "bar/", "*.tmp", "/baz"], "root")
+    assert ignore.literals == {"foo"}
+    assert ignore.dir_literals == {"bar"}
+
+    ignore = DvcIgnorePatterns(["foo", "bar/", "!foo"], "root")
+    assert not ignore.literals
+    assert not ignore.dir_literals
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["foo"],
+        ["foo/"],
+        ["foo "],
+        ["foo/ "],
+        ["foo\\ "],
+        ["\\#foo"],
+        ["#foo"],
+        ["\\!foo"],
+        ["!foo"],
+        ["foo", "!foo"],
+        ["foo/", "!foo"],
+        ["foo", "bar/", "*.tmp"],
+        [".git", ".git/", ".hg/", ".dvc/"],
+    ],
+)
+@pytest.mark.parametrize(
+    "path",
+    [
+        "foo",
+        "foo ",
+        "#foo",
+        "!foo",
+        "foobar",
+        "dir/foo",
+        "foo/bar",
+        "dir/foo/bar",
+        "bar",
+        "bar/x.tmp",
+        ".git/config",
+        ".dvc",
+    ],
+)
+@pytest.mark.parametrize("is_dir", [True, False])
+def test_literal_patterns_match_regex(patterns, path, is_dir):
+    ignore = DvcIgnorePatterns(patterns, "root")
+    # NOTE: any negated pattern disables the literal sets, so this one goes
+    # through the regex only
+    regex_only = DvcIgnorePatterns(patterns + ["!never-matches"], "root")
+    assert not regex_only.literals
+    assert not regex_only.dir_literals
+
+    assert ignore.ignore(path, is_dir) == regex_only.ignore(path, is_dir)
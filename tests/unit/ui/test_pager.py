@@ -8,6 +8,7 @@ from dvc.utils.pager import (
     find_pager,
     make_pager,
     pager,
+    pager_pipe,
 )
 
 
@@ -97,3 +98,12 @@ def test_pager(mocker, monkeypatch):
     pager("hello world")
     m_make_pager.assert_called_once_with("my-pager")
     _pager.assert_called_once_with("hello world")
+
+
+def test_pager_pipe_when_no_pager_found(mocker, capsys):
+    mocker.patch("dvc.utils.pager.find_pager", return_value=None)
+
+    with pager_pipe() as stream:
+        stream.write("hello world")
+
+    assert capsys.readouterr().out == "hello world"
@@ -138,7 +138,11 @@ def test_rich_styles(capsys: CaptureFixture[str], extra_opts):
 
 
 def test_rich_pager(mocker: MockerFixture):
-    pager_mock = mocker.patch("dvc.utils.pager.pager")
+    from io import StringIO
+
+    stream = StringIO()
+    pager_mock = mocker.patch("dvc.utils.pager.pager_pipe")
+    pager_mock.return_value.__enter__.return_value = stream
 
     ui.table(
         [("foo", "bar"), ("foo1", "bar1"), ("foo2", "bar2")],
@@ -146,7 +150,7 @@ def test_rich_pager(mocker: MockerFixture):
         rich_table=True,
         pager=True,
     )
-    received_text = pager_mock.call_args[0][0]
+    received_text = stream.getvalue()
     assert [
         row.strip() for row in received_text.splitlines() if row.strip()
     ] == ["first  second", "foo    bar", "foo1   bar1", "foo2   bar2"]
@@ -0,0 +1,32 @@
+import pytest
+
+from dvc.utils.flatten import flatten
+
+
+def test_flatten():
+    d = {
+        "a": 1,
+        "b": {"c": {"d": 2, "e": [3]}, "f": {}, "g": "4"},
+        "h": None,
+    }
+    assert flatten(d) == {
+        "a": 1,
+        "b.c.d": 2,
+        "b.c.e": [3],
+        "b.g": "4",
+        "h": None,
+    }
+    assert list(flatten(d)) == ["a", "b.c.d", "b.c.e", "b.g", "h"]
+
+
+def test_flatten_empty():
+    assert flatten({}) == {}
+    assert flatten({"a": {}}) == {}
+
+
+@pytest.mark.parametrize(
+    "d", [{"a.b": 1, "a": {"b": 2}}, {"a": {"b": 2}, "a.b": 1}]
+)
+def test_flatten_duplicated_key(d):
+    with pytest.raises(ValueError, match="duplicated key 'a.b'"):
+        flatten(d)
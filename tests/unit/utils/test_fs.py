@@ -12,8 +12,10 @@ from dvc.system import System
 from dvc.utils import relpath
 from dvc.utils.fs import (
     BasePathNotInCheckedPathException,
+    chdir,
     contains_symlink_up_to,
     copy_fobj_to_file,
+    copy_tree,
     copyfile,
     get_inode,
     get_mtime_and_size,
@@ -295,3 +297,27 @@ def test_copy_fobj_to_file(tmp_dir):
 
 def test_walk_files(tmp_dir):
     assert list(walk_files(".")) == list(walk_files(tmp_dir))
+
+
+def test_chdir(tmp_dir):
+    tmp_dir.gen({"dir": {}})
+    cwd = os.getcwd()
+
+    with pytest.raises(RuntimeError):
+        with chdir("dir"):
+            assert os.getcwd() == os.path.join(cwd, "dir")
+            raise RuntimeError
+
+    assert os.getcwd() == cwd
+
+
+def test_copy_tree(tmp_dir):
+    tmp_dir.gen({"src": {"foo": "foo", "dir": {"bar": "bar", "empty": {}}}})
+    (tmp_dir / "dst").mkdir()
+
+    copy_tree("src", "dst", jobs=2)
+
+    assert (tmp_dir / "dst").read_text() == {
+        "foo": "foo",
+        "dir": {"bar": "bar", "empty": {}},
+    }
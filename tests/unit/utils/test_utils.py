@@ -9,6 +9,7 @@ from dvc.utils import (
     dict_sha256,
     file_md5,
     fix_env,
+    memoize_locked,
     parse_target,
     relpath,
     resolve_output,
@@ -232,3 +233,13 @@ def test_hint_on_lockfile():
 )
 def test_dict_sha256(d, sha):
     assert dict_sha256(d) == sha
+
+
+def test_memoize_locked(mocker):
+    func = mocker.Mock(side_effect=[None, "value"])
+    memoized = memoize_locked(func)
+
+    assert memoized("foo", "bar") is None
+    assert memoized("foo", "bar") is None
+    assert memoized("baz") == "value"
+    assert func.call_count == 2